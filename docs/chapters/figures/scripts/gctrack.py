@@ -1,6 +1,8 @@
 import os
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa
 import cartopy.crs as ccrs
 import lwsspy.maps
 import lwsspy.base
@@ -19,9 +21,10 @@ qlat, qlon, _ = lwsspy.maps.gctrack(lat, lon, edist)
 plt.figure(figsize=(8, 4.5))
 ax = lwsspy.maps.map_axes("carr")
 ax.set_global()
-lwsspy.maps.plot_map()
+lwsspy.maps.plot_map(ax=ax)
 plt.plot(lon, lat, color='k',  transform=ccrs.PlateCarree())
 plt.plot(qlon, qlat, color='r',  transform=ccrs.PlateCarree())
 
 plt.savefig(os.path.join(lwsspy.base.DOCFIGURES,
-                         "gctrack.svg"), transparent=True)
+                         "gctrack.svg"), transparent=True,
+            metadata={'Date': None})
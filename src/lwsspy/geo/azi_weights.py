@@ -45,14 +45,12 @@ def azi_weights(lat0, lon0, lat, lon, weights=None, nbins=12, p=0.5):
     # Compute
     az = vazfunc(lat, lon)
 
-    # Bins
-    bins = np.arange(0, 360.1, 360/nbins)
+    # Find which az is in which bin. The bins are uniform, so the index
+    # follows from scaling, no search necessary
+    binass = np.minimum((np.asarray(az) * (nbins/360)).astype(int), nbins - 1)
 
     # Histogram
-    H, _ = np.histogram(az, bins=bins, weights=weights)
-
-    # Find which az is in which bin
-    binass = np.digitize(az, bins) - 1
+    H = np.bincount(binass, weights=weights, minlength=nbins)
 
     # Compute weights
     w = (1/H[binass])**p
@@ -1,6 +1,5 @@
 import numpy as np
 from .. import math as lmat
-import matplotlib.pyplot as plt
 
 
 class GeoWeights:
@@ -32,6 +31,9 @@ class GeoWeights:
         self.kdtree = lmat.SphericalNN(self.lat, self.lon)
         self.dij = self.kdtree.sparse_distance_matrix()
 
+        # Squared distances are reused for every reference distance
+        self.dij2 = self.dij**2
+
     def get_weights(self, ref: float = 1.0):
         """Compute the weights based on equation 22 in Ruan et al. 2019
 
@@ -46,7 +48,9 @@ class GeoWeights:
             weights
         """
 
-        distsexp = np.exp(-(self.dij/ref)**2)
+        # Single scaled pass over the squared distances, exp in place
+        distsexp = np.multiply(self.dij2, -1.0/ref**2)
+        np.exp(distsexp, out=distsexp)
         w = 1.0 / np.sum(distsexp, axis=1)
         w /= np.sum(w) / len(w)
 
@@ -70,11 +70,13 @@ def get_slab_minmax(dss=None):
     if dss is None:
         dss = get_slabs()
 
-    # Get vmin, vmax
-    mins, maxs = [], []
-    for ds in dss:
-        mins.append(np.nanmin(ds['z'][:, :].data))
-        maxs.append(np.nanmax(ds['z'][:, :].data))
+    # Get vmin, vmax, reading each depth grid only once
+    mins = np.empty(len(dss))
+    maxs = np.empty(len(dss))
+    for _i, ds in enumerate(dss):
+        z = ds['z'][:, :].data
+        mins[_i] = np.nanmin(z)
+        maxs[_i] = np.nanmax(z)
 
     vmin = np.min(mins)
     vmax = np.max(maxs)
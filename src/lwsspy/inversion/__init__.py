@@ -1,5 +1,6 @@
 # Inversion
 from .optimizer import Optimization  # noqa
 from .plot_optimization import plot_optimization  # noqa
+from .plot_optimization import release_optimization  # noqa
 from .plot_model_history import plot_model_history  # noqa
 from .plot_single_parameter_optimization import plot_single_parameter_optimization  # noqa
@@ -91,8 +91,8 @@ def Solve_Optimisation_Problem(optim, model):
     else:
         raise ValueError("Optimization algorithm not recognized")
 
-    optim.model_ini = deepcopy(model)
-    optim.model = deepcopy(model)
+    optim.model_ini = np.array(model)
+    optim.model = np.array(model)
     optim.n = len(model)
 
     if (optim.nb_mem < 1):
@@ -1,11 +1,75 @@
 from typing import Union, List
-import numpy as np
 import matplotlib.pyplot as plt
 from .optimizer import Optimization
 
+# Figures that are updated in place during an inversion, keyed on the ids of
+# the plotted optimizations
+_LIVE = dict()
+
+
+def _history(c):
+    """Returns x and y of a cost history."""
+
+    return range(len(c)), c
+
+
+def _update_optimization(live: dict, outfile: str or None = None):
+    """Updates the misfit lines of a live figure. On screen only the lines
+    are redrawn using blitting, the full figure is only redrawn if the lines
+    left the current limits. If saved to ``outfile``, the figure is redrawn
+    by ``savefig`` anyways, so there is no blitting."""
+
+    fig, ax, lines = live['fig'], live['ax'], live['lines']
+
+    # Update the data of the lines
+    for _line, _opt in zip(lines, live['optim']):
+        _line.set_data(*_history(_opt.fcost_hist))
+
+    if outfile is not None:
+        # Animated artists are skipped by savefig
+        for _line in lines:
+            _line.set_animated(False)
+        ax.relim()
+        ax.autoscale_view()
+        fig.savefig(outfile)
+        return
+
+    # Take the lines out of the normal draw and store the background without
+    # them, if the figure has only been saved so far
+    if live.get('background') is None or not lines[0].get_animated():
+        for _line in lines:
+            _line.set_animated(True)
+        fig.canvas.draw()
+        live['background'] = fig.canvas.copy_from_bbox(ax.bbox)
+
+    # Check whether the new data still fit into the axes
+    xmin, xmax = ax.get_xlim()
+    ymin, ymax = ax.get_ylim()
+    inside = True
+    for _line in lines:
+        x, y = _line.get_data()
+        if len(x) == 0:
+            continue
+        if (x[-1] > xmax) or (min(y) < ymin) or (max(y) > ymax):
+            inside = False
+            break
+
+    if inside:
+        fig.canvas.restore_region(live['background'])
+    else:
+        ax.relim()
+        ax.autoscale_view()
+        fig.canvas.draw()
+        live['background'] = fig.canvas.copy_from_bbox(ax.bbox)
+
+    for _line in lines:
+        ax.draw_artist(_line)
+    fig.canvas.blit(ax.bbox)
+    fig.canvas.flush_events()
+
 
 def plot_optimization(optim: Union[List[Optimization], Optimization],
-                      outfile: str or None = None):
+                      outfile: str or None = None, update: bool = False):
     """Plotting Misfit Reduction
 
     Parameters
@@ -15,23 +79,82 @@ def plot_optimization(optim: Union[List[Optimization], Optimization],
     outfile : str or None, optional
         Define where to save the figure. If None, plot is shown,
         by default None
+    update : bool, optional
+        Meant for plotting the misfit every iteration. If True, the figure
+        of an earlier call with the same optimizations is reused and only
+        the misfit lines are redrawn using blitting. Use
+        ``release_optimization`` to close the figure once the inversion is
+        done, by default False
     """
     if type(optim) is not list:
         optim = [optim]
+
+    key = tuple(id(_opt) for _opt in optim)
+
+    # Forget figures that were closed by the user, a new one is created below
+    if key in _LIVE and not plt.fignum_exists(_LIVE[key]['fig'].number):
+        del _LIVE[key]
+
+    if update and key in _LIVE:
+        _update_optimization(_LIVE[key], outfile)
+        return
+
     # Plot values
-    plt.figure(figsize=(6, 6))
-    ax = plt.axes()
-    # ax.set_yscale("log")
+    fig, ax = plt.subplots(figsize=(6, 6))
+    lines = []
     for _opt in optim:
         # Get values
-        c = _opt.fcost_hist
-        it = np.arange(len(c))
-        plt.plot(it, c, label=_opt.type.upper())
+        line, = ax.plot(*_history(_opt.fcost_hist),
+                        label=_opt.type.upper(),
+                        animated=update and outfile is None)
+
+        # Long lines are rasterized so that vector outputs stay small, axes
+        # and text remain vector graphics
+        if len(_opt.fcost_hist) > 1000:
+            line.set_rasterized(True)
+
+        lines.append(line)
     ax.set_yscale('log')
-    plt.legend(loc=1)
-    plt.title("Misfit Reduction")
+    ax.legend(loc=1)
+    ax.set_title("Misfit Reduction")
 
-    if outfile is not None:
-        plt.savefig(outfile)
+    if update:
+        _LIVE[key] = dict(fig=fig, ax=ax, lines=lines, optim=optim,
+                          background=None)
+
+        # Show the live figure without blocking the inversion, the background
+        # for the blitting is stored by the first update
+        if outfile is None:
+            plt.show(block=False)
+
+        _update_optimization(_LIVE[key], outfile)
+
+    elif outfile is not None:
+        fig.savefig(outfile)
     else:
         plt.show()
+
+
+def release_optimization(optim: Union[List[Optimization], Optimization,
+                                      None] = None):
+    """Closes the live figures of ``plot_optimization(..., update=True)``
+    and releases the references to their optimizations.
+
+    Parameters
+    ----------
+    optim : Optimization or list of Optimization, optional
+        Optimization(s) whose live figure is released, by default None,
+        which releases all live figures
+    """
+
+    if optim is None:
+        keys = list(_LIVE.keys())
+    else:
+        if type(optim) is not list:
+            optim = [optim]
+        keys = [tuple(id(_opt) for _opt in optim)]
+
+    for key in keys:
+        live = _LIVE.pop(key, None)
+        if live is not None:
+            plt.close(live['fig'])
@@ -1,6 +1,7 @@
 # Maps
 from .bearing import bearing  # noqa
 from .fix_map_extent import fix_map_extent  # noqa
+from .fix_map_extent import fix_map_extents  # noqa
 from .in_extent import in_extent  # noqa
 from .line_buffer import line_buffer  # noqa
 from .haversine import haversine  # noqa
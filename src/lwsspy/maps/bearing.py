@@ -7,7 +7,10 @@ def bearing(lon1, lat1, lon2, lat2):
 
     dL = lon2 - lon1
 
-    X = cos(lat2) * sin(dL)
-    Y = cos(lat1) * sin(lat2) - sin(lat1) * cos(lat2) * cos(dL)
+    # cos(lat2) is needed twice
+    coslat2 = cos(lat2)
+
+    X = coslat2 * sin(dL)
+    Y = cos(lat1) * sin(lat2) - sin(lat1) * coslat2 * cos(dL)
 
     return degrees(arctan2(X, Y))
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def fix_map_extent(extent, fraction=0.05):
 
     # Get extent values and fix them
@@ -6,28 +9,35 @@ def fix_map_extent(extent, fraction=0.05):
     latb = (maxlat - minlat) * fraction
     lonb = (maxlon - minlon) * fraction
 
-    # Max lat
-    if maxlat + latb > 90.0:
-        maxlat = 90.0
-    else:
-        maxlat = maxlat + latb
-
-    # Min lat
-    if minlat - latb < -90.0:
-        minlat = -90.0
-    else:
-        minlat = minlat - latb
-
-    # Max lon
-    if maxlon + lonb > 180.0:
-        maxlon = 180.0
-    else:
-        maxlon = maxlon + lonb
-
-    # Minlon
-    if minlon - lonb < -180.0:
-        minlon = -180.0
-    else:
-        minlon = minlon - lonb
-
-    return [minlon, maxlon, minlat, maxlat]
+    # Pad and clamp to the globe in one go
+    return [max(-180.0, minlon - lonb), min(180.0, maxlon + lonb),
+            max(-90.0, minlat - latb), min(90.0, maxlat + latb)]
+
+
+def fix_map_extents(extents, fraction=0.05):
+    """Same as ``fix_map_extent``, but for a batch of extents.
+
+    Parameters
+    ----------
+    extents : arraylike
+        (N, 4) array of ``[minlon, maxlon, minlat, maxlat]`` extents
+    fraction : float, optional
+        fraction of the extent width that is added on each side,
+        by default 0.05
+
+    Returns
+    -------
+    np.ndarray
+        (N, 4) array of padded extents clamped to the globe
+    """
+
+    extents = np.asarray(extents, dtype=float)
+    minlon, maxlon, minlat, maxlat = extents.T
+
+    latb = (maxlat - minlat) * fraction
+    lonb = (maxlon - minlon) * fraction
+
+    return np.stack((np.maximum(-180.0, minlon - lonb),
+                     np.minimum(180.0, maxlon + lonb),
+                     np.maximum(-90.0, minlat - latb),
+                     np.minimum(90.0, maxlat + latb)), axis=1)
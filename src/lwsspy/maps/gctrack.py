@@ -1,13 +1,11 @@
 from typing import Tuple
 import numpy as np
-from scipy.interpolate import interp1d
-from .reckon import reckon
-from cartopy.geodesic import Geodesic
 from .. import base as lbase
 
 
 def geodiff(lat, lon):
     """Computes Azimuths and distances between geographical points."""
+    from cartopy.geodesic import Geodesic
 
     # Create Geodesic class
     G = Geodesic(flattening=0.0)
@@ -38,6 +36,44 @@ def geodist(lat, lon):
     return cdists
 
 
+def unitvec(lat, lon):
+    """Converts geographical coordinates in degrees to a (3, N) array of
+    unit vectors. Each component is a contiguous row."""
+
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    coslat = np.cos(lat)
+
+    # Fill the components in place
+    A = np.empty((3, lat.size))
+    np.cos(lon, out=A[0])
+    A[0] *= coslat
+    np.sin(lon, out=A[1])
+    A[1] *= coslat
+    np.sin(lat, out=A[2])
+
+    return A
+
+
+def vec2geo(A):
+    """Converts a (3, N) array of vectors to latitude and longitude in
+    degrees."""
+
+    lat = np.degrees(np.arctan2(A[2], np.hypot(A[0], A[1])))
+    lon = np.degrees(np.arctan2(A[1], A[0]))
+
+    return lat, lon
+
+
+def gcangle(A, B):
+    """Great-circle angle in radians between columns of two (3, N) unit
+    vector arrays. The ``arctan2`` form is stable for both tiny and
+    antipodal separations."""
+
+    return np.arctan2(np.linalg.norm(np.cross(A, B, axis=0), axis=0),
+                      np.sum(A * B, axis=0))
+
+
 def gctrack(
         lat, lon, dist: float = 1.0, constantdist: bool = True) -> Tuple[
             np.ndarray, np.ndarray, np.ndarray]:
@@ -99,72 +135,74 @@ def gctrack(
 
     """
 
-    # First get distances between points
+    # Unit vectors of the waypoints and the great-circle angle between them
     N = len(lon)
-    # dists = np.zeros(N-1)
-    # az = np.zeros(N-1)
-
-    # Create Geodesic class
-    G = Geodesic(flattening=0.0)
-
-    # Get tracks between segments that are far apart
-    dists, az = geodiff(lat, lon)
+    A = unitvec(lat, lon)
+    omega = gcangle(A[:, :-1], A[:, 1:])
+    dists = np.degrees(omega)
 
     if np.any(dists/100 < dist):
         raise ValueError(
             "Final deltadeg between points in tracks should be at least "
             "100 times less smallest distance between waypoints.")
 
-    if not constantdist:
-        updated_dist = []
-
-    # Cumulative station distances
-    sdists = np.zeros(N)
-    sdists[1:] = np.cumsum(dists)
-
-    tracks = []
-    for _i in range(N-1):
-
-        # Choice of created equally space vector a long the track
-        if constantdist:
-            # New dist vector
-            trackdists = np.arange(0, dists[_i], dist)
-        else:
-            # Get the length of the linspace
-            N = int(np.round((dists[_i])/dist))
-
-            # Get the closest distance measure
-            updist = dists[_i]/N
-
-            # Attached to list.
-            updated_dist.append(updist)
-
-            trackdists = np.linspace(0, dists[_i] - updist, N)
-
-        track = np.array(reckon(lat[_i], lon[_i], trackdists, az[_i]))
-
-        # Remove geolocations that overshot
-        tmpdist = geodist(track[0, :], track[1, :])
-        track = track[:, np.where(tmpdist < dists[_i])[0]]
-        tracks.append(track)
+    # Choice of created equally space vector a long the track
+    if constantdist:
+        # Same as the length of np.arange(0, dists[_i], dist)
+        counts = np.ceil(dists/dist).astype(int)
+        steps = np.full(N-1, dist)
+    else:
+        # Get the length of the linspace and the closest distance measure
+        counts = np.round(dists/dist).astype(int)
+        steps = dists/counts
+        updated_dist = steps.tolist()
+
+    # Segment index and position in segment for every new point
+    seg = np.repeat(np.arange(N-1), counts)
+    k = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    # Fraction of the segment for each point; always < 1, so nothing overshoots
+    t = k * steps[seg] / dists[seg]
+
+    # Unit tangent at each segment start, pointing along the great circle
+    # towards the segment end
+    U = A[:, 1:] - np.cos(omega) * A[:, :-1]
+    unorm = np.linalg.norm(U, axis=0)
+
+    # For (near-)antipodal waypoints that direction is undefined, any great
+    # circle connects them. Like the geodesic azimuth, head north then.
+    anti = unorm < 1e-8
+    if np.any(anti):
+        alat = np.radians(np.asarray(lat, dtype=float)[:-1][anti])
+        alon = np.radians(np.asarray(lon, dtype=float)[:-1][anti])
+        U[:, anti] = np.array((-np.sin(alat) * np.cos(alon),
+                               -np.sin(alat) * np.sin(alon),
+                               np.cos(alat)))
+        unorm[anti] = 1.0
+    U /= unorm
+
+    # Rotate along the great circles, all points at once
+    theta = t * omega[seg]
+    P = np.empty((3, len(seg) + 1))
+    np.multiply(A[:, seg], np.cos(theta), out=P[:, :-1])
+    P[:, :-1] += U[:, seg] * np.sin(theta)
 
     # Add last point because usually not added
-    tracks.append(np.array(((lat[-1], lon[-1]),)).T)
+    P[:, -1] = A[:, -1]
 
     # Get tracks
-    utrack = np.hstack(tracks).T
+    utrack = np.vstack(vec2geo(P)).T
 
     # Remove duplicates if there are any
     _, idx = np.unique(utrack, return_index=True, axis=0)
-    utrack = utrack[np.sort(idx), :]
-
-    # Get distances along the new track
-    udists, _ = geodiff(utrack[:, 0], utrack[:, 1])
+    idx = np.sort(idx)
+    utrack = utrack[idx, :]
+    P = P[:, idx]
 
-    # Compute cumulative distance
+    # Compute cumulative distance along the new track
     M = len(utrack[:, 0])
     cdists = np.zeros(M)
-    cdists[1:] = np.cumsum(udists)
+    cdists[1:] = np.cumsum(np.degrees(gcangle(P[:, :-1], P[:, 1:])))
 
     if constantdist:
         return utrack[:, 0], utrack[:, 1], cdists
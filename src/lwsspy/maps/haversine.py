@@ -29,13 +29,18 @@ def haversine(lon1, lat1, lon2, lat2):
         distance in km for a spherical earth with r = 6371 km.
     """
 
-    lon1, lat1, lon2, lat2 = map(np.radians, [lon1, lat1, lon2, lat2])
-
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-
-    a = np.sin(dlat/2.0)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2.0)**2
-
-    c = 2 * np.arcsin(np.sqrt(a))
+    # Take the differences in degrees and scale the half angles only once
+    d2r = np.pi / 180.0
+    dlon = (np.asarray(lon2) - lon1) * (d2r / 2.0)
+    dlat = (np.asarray(lat2) - lat1) * (d2r / 2.0)
+
+    a = np.sin(dlat)**2 \
+        + np.cos(np.multiply(lat1, d2r)) * np.cos(np.multiply(lat2, d2r)) \
+        * np.sin(dlon)**2
+
+    # Rounding can push a slightly outside [0, 1] for (near-)antipodal
+    # points, clamp it so that both square roots stay real
+    a = np.clip(a, 0.0, 1.0)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
     km = 6371 * c
     return km
@@ -106,7 +106,7 @@ def plot_litho(which="all", parameter="depth", print_keys: bool = False,
                 # Plot the map
                 plt.sca(axs[_i, _j])
                 # Plot coastlines
-                lmap.plot_map(fill=False)
+                lmap.plot_map(fill=False, ax=axs[_i, _j])
                 # Plot surface
                 axs[_i, _j].imshow(
                     getattr(litho, _key + _v + _parameter)[::-1, :],
@@ -137,7 +137,7 @@ def plot_litho(which="all", parameter="depth", print_keys: bool = False,
                 subplot_kw={'projection': PlateCarree()})
             plt.sca(axs)
             axs.set_rasterization_zorder(-10)  # Important line!
-            lmap.plot_map(fill=False)
+            lmap.plot_map(fill=False, ax=axs)
             im = axs.imshow(
                 getattr(litho,  which + "_top" + _parameter)[::-1, :],
                 extent=extent, zorder=-20)
@@ -170,7 +170,7 @@ def plot_litho(which="all", parameter="depth", print_keys: bool = False,
             # Populating the subplots
             for _j, _v in enumerate(mods.keys()):
                 plt.sca(axs[_j])
-                lmap.plot_map(fill=False)
+                lmap.plot_map(fill=False, ax=axs[_j])
                 axs[_j].imshow(
                     getattr(litho, which + _v + _parameter)[::-1, :],
                     extent=extent, cmap=cmap, norm=norm)
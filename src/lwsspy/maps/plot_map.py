@@ -1,8 +1,4 @@
 import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
-import cartopy
-from cartopy.mpl.ticker import LongitudeFormatter, LatitudeFormatter
-from cartopy.crs import PlateCarree, Mollweide, UTM
 
 # steps = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
 #          1, 1.5, 2, 2.5, 5, 10, 15, 20, 25, 30, 45]
@@ -13,7 +9,8 @@ def plot_map(fill=True, zorder=None, labelstopright: bool = True,
              labelsbottomleft: bool = True, borders: bool = False,
              rivers: bool = False, lakes: bool = False, outline: bool = False,
              oceanbg=None, ax=None, lw=0.5):
-    """Plots map into existing axes.
+    """Plots map into existing axes. The projection is the one of the axes,
+    there is nothing to be built per call.
 
     Parameters
     ----------
@@ -21,8 +18,6 @@ def plot_map(fill=True, zorder=None, labelstopright: bool = True,
         fills the continents in light gray, by default True
     zorder : int, optional
         zorder of the map, by default -10
-    projection : cartopy.crs.projection, optional
-        projection to be used for the map.
     labelstopright : bool, optional
         flag to turn on or off the ticks
     labelsbottomleft : bool, optional
@@ -33,6 +28,13 @@ def plot_map(fill=True, zorder=None, labelstopright: bool = True,
         plot rivers. Default False
     lakes : bool 
         plot lakes. Default True
+    outline : bool
+        draw the coastlines. Default False
+    oceanbg : color, optional
+        fill the ocean with this color, by default None
+    ax : matplotlib.axes.Axes, optional
+        GeoAxes to plot the map into. Passing it avoids the ``plt.gca()``
+        lookup, by default None, which uses the current axes
     lw : float
         outline width
 
@@ -53,6 +55,9 @@ def plot_map(fill=True, zorder=None, labelstopright: bool = True,
 
     """
 
+    # Cartopy is only needed once a map is actually plotted
+    import cartopy.feature
+
     if ax is None:
         ax = plt.gca()
 
@@ -68,9 +73,11 @@ def plot_map(fill=True, zorder=None, labelstopright: bool = True,
     if fill:
         ax.add_feature(cartopy.feature.LAND, zorder=zorder, edgecolor=edgecolor,
                        linewidth=0.5, facecolor=(0.8, 0.8, 0.8))
-    else:
-        ax.add_feature(cartopy.feature.LAND, zorder=zorder, edgecolor=edgecolor,
-                       linewidth=0.5, facecolor=(0, 0, 0, 0))
+    elif outline:
+        # Edges only, coastlines are lines and much cheaper than polygons
+        ax.add_feature(cartopy.feature.COASTLINE, zorder=zorder,
+                       edgecolor=edgecolor, linewidth=0.5)
+    # Neither fill nor outline means there is nothing visible to draw
 
     if oceanbg:
         ax.add_feature(cartopy.feature.OCEAN, zorder=zorder, edgecolor='none',
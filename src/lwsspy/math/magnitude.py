@@ -1,3 +1,4 @@
+import math
 import numpy as np
 
 
@@ -17,11 +18,17 @@ def magnitude(x: float):
         x = np.array(x)
 
     if type(x) != np.ndarray:
-        if x != 0:
+        # Plain math is much cheaper than numpy's ufuncs for finite scalars,
+        # inf and nan go through numpy, which passes them through
+        if x != 0 and math.isfinite(x):
+            return np.float64(math.floor(math.log10(abs(x))))
+        elif x != 0:
             return np.floor(np.log10(np.abs(x)))
         else:
             return 0
     else:
-        out = np.zeros_like(x)
-        out[x != 0] = np.floor(np.log10(np.abs(x[x != 0])))
-        return out.astype(int)
+        # Single pass over the nonzero entries, zeros stay zero
+        nonzero = x != 0
+        out = np.zeros(x.shape)
+        np.log10(np.abs(x), out=out, where=nonzero)
+        return np.floor(out, out=out).astype(int)
@@ -1,7 +1,19 @@
+from functools import lru_cache
 import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.colorbar import Colorbar
 from .. import utils as lutils
 
+# Keywords that only concern the placement of new colorbar axes
+_LAYOUT_KEYS = ['ax', 'use_gridspec', 'fraction', 'pad', 'shrink', 'aspect',
+                'anchor', 'panchor']
+
+
+@lru_cache(maxsize=8)
+def _label_size(fontsize):
+    """Cached reduced label size for a given ``xtick.labelsize``."""
+    return lutils.reduce_fontsize(fontsize)
+
 
 def nice_colorbar(*args, fig: bool = False, **kwargs) -> matplotlib.colorbar.Colorbar:
     """Creates nicely formatted colorbar. ``*args`` and ``**kwargs`` are parsed 
@@ -25,10 +37,25 @@ def nice_colorbar(*args, fig: bool = False, **kwargs) -> matplotlib.colorbar.Col
 
     # Get normal axes labelsize
     xticklabelsize = matplotlib.rcParams['xtick.labelsize']
-    newlabelsize = lutils.reduce_fontsize(xticklabelsize)
+    newlabelsize = _label_size(xticklabelsize)
 
     # Change label size to a good size: 70 % of axes label size
-    c = plt.colorbar(*args, **kwargs)
+    if kwargs.get('cax', None) is not None:
+        # With given colorbar axes nothing has to be laid out, so the
+        # colorbar is built directly
+        cax = kwargs.pop('cax')
+        mappable = args[0] if len(args) > 0 else kwargs.pop('mappable', None)
+        if mappable is None:
+            mappable = plt.gci()
+        if mappable is None:
+            raise RuntimeError('No mappable was found to use for colorbar '
+                               'creation.')
+        for _key in _LAYOUT_KEYS:
+            kwargs.pop(_key, None)
+        c = Colorbar(cax, mappable, **kwargs)
+        cax.figure.stale = True
+    else:
+        c = plt.colorbar(*args, **kwargs)
     c.ax.tick_params(labelsize=newlabelsize)
     c.ax.yaxis.label.set_size(newlabelsize)
     c.ax.xaxis.label.set_size(newlabelsize)
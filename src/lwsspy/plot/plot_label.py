@@ -1,6 +1,5 @@
 from typing import Union
 import matplotlib
-import matplotlib.pyplot as plt
 from .get_aspect import get_aspect
 
 
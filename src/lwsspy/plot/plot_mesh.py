@@ -163,7 +163,7 @@ class MeshPlot():
             self.mesh.bounds
 
         # Get min/max radius, depth
-        self.r = np.sqrt(np.sum(deepcopy(self.mesh.points)**2, axis=1))
+        self.r = np.sqrt(np.sum(self.mesh.points**2, axis=1))
         self.rmin = np.min(self.r)
         self.rmax = np.max(self.r)
         self.dmin = self.rmax - self.rmax
@@ -890,7 +890,7 @@ class MeshPlot():
         # Create Map
         fig = plt.figure()
         ax = lmaps.map_axes(proj='carr')
-        lmaps.plot_map(zorder=1, borders=False, fill=False)
+        lmaps.plot_map(zorder=1, borders=False, fill=False, ax=ax)
         ax.set_xlim(lonmin, lonmax)
         ax.set_ylim(latmin, latmax)
 
@@ -1,5 +1,4 @@
 import matplotlib
-import matplotlib.pyplot as plt
 
 
 def right_align_legend(legend: matplotlib.legend.Legend):
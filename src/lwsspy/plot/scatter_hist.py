@@ -190,21 +190,28 @@ def scatter_hist(x, y, nbins, z=None, cmap=None,
     ax_scatter.set_ylim((miny - prec * dy, maxy + prec * dy))
 
     for _i, (x, y, c, l) in enumerate(zip(xl, yl, cl, ll)):
-        # Plot y histogram
-        ax_histx.hist(x, bins=binsx, facecolor=c,
+        # Bin the data only once, fill and outline are drawn from the counts
+        # by weighting the left bin edges
+        nx, _ = np.histogram(x, bins=binsx)
+        ny, _ = np.histogram(y, bins=binsy)
+
+        # Plot x histogram
+        ax_histx.hist(binsx[:-1], bins=binsx, weights=nx, facecolor=c,
                       edgecolor='none', zorder=2*len(xl) - _i - 0.5,
                       alpha=0.75)
-        ax_histx.hist(x, bins=binsx, color='k', histtype='step',
-                      facecolor='none', zorder=2*len(xl) - _i)
+        ax_histx.hist(binsx[:-1], bins=binsx, weights=nx, color='k',
+                      histtype='step', facecolor='none',
+                      zorder=2*len(xl) - _i)
         ax_histx.set_xlim(ax_scatter.get_xlim())
 
         # Plot y histogram
-        ax_histy.hist(y, bins=binsy, orientation='horizontal',
-                      facecolor=c, edgecolor='none', zorder=2*len(xl) - _i - 0.5,
+        ax_histy.hist(binsy[:-1], bins=binsy, weights=ny,
+                      orientation='horizontal', facecolor=c,
+                      edgecolor='none', zorder=2*len(xl) - _i - 0.5,
                       alpha=0.75)
-        ax_histy.hist(y, bins=binsy, orientation='horizontal',
-                      color='k', histtype='step', facecolor='none',
-                      zorder=2*len(xl) - _i)
+        ax_histy.hist(binsy[:-1], bins=binsy, weights=ny,
+                      orientation='horizontal', color='k', histtype='step',
+                      facecolor='none', zorder=2*len(xl) - _i)
         ax_histy.set_ylim(ax_scatter.get_ylim())
 
     # Remove boundaries
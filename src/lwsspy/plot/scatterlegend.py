@@ -1,4 +1,4 @@
-from typing import Callable, DefaultDict, Optional, Union
+from typing import Callable, DefaultDict, Iterable, Optional, Union
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.colors import BoundaryNorm, Normalize, Colormap
@@ -6,6 +6,30 @@ from matplotlib.lines import Line2D
 from matplotlib.legend import Legend
 
 
+def _legend_handles(values, cmap, norm, sizefunc, lkw, sizes=None):
+    """Returns the ``Line2D`` proxies for ``values``."""
+
+    # Sample the colormap for all values at once
+    colors = cmap(norm(np.asarray(values)))
+
+    # Get markersizes from the given sizes, a function or a number. The
+    # function is evaluated once for all values
+    if sizes is not None:
+        mss = np.sqrt(np.asarray(sizes, dtype=float))
+    elif callable(sizefunc):
+        mss = np.sqrt(sizefunc(np.abs(np.asarray(values, dtype=float))))
+    else:
+        mss = np.full(len(values), sizefunc)
+
+    handles = []
+    for color, ms in zip(colors, mss):
+
+        # Create handle
+        handles.append(Line2D([0], [0], ls="", color=color, ms=ms, **lkw))
+
+    return handles
+
+
 def scatterlegend(
         values,
         cmap: Optional[Colormap] = None,
@@ -16,6 +40,7 @@ def scatterlegend(
         lkw=dict(marker='o', markeredgecolor="k", lw=0.2),
         orientation: str = 'h',
         yoffset: float = -50,
+        sizes: Optional[Iterable] = None,
         * args, **kwargs) -> Legend:
     """Creates legend of scatter values parsed to function, including a color
     defined by cmap and norm.
@@ -30,7 +55,8 @@ def scatterlegend(
         Norm, by default None
     sizefunc : Union[Callable, float], optional
         Function to define the size of the markers, or float to define size,
-        by default 5
+        by default 5. The function is called once with the array of absolute
+        values, so it should work on numpy arrays
     handletextpad: float, optional
         Use to adjust the location of the text underneath the labels. Positive
         values shift the text to the right, default
@@ -45,6 +71,9 @@ def scatterlegend(
         `h` for horizonatal, 'v' for vertical, by default 'h'
     yoffset: float
         offset of loegend text, different for png and pdf outputs, default -50
+    sizes : Optional[Iterable], optional
+        Marker areas (as in ``scatter``'s ``s``) for each value. If given,
+        ``sizefunc`` is not used, by default None
 
 
     Returns
@@ -54,23 +83,8 @@ def scatterlegend(
     """
 
     # Get handles and labels
-    handles, labels = [], []
-
-    # For each value
-    for v in values:
-
-        # Get markersize from float or functions
-        if isinstance(sizefunc, float):
-            ms = sizefunc
-        else:
-            ms = np.sqrt(sizefunc(np.abs(v)))
-
-        # Create handle
-        h = Line2D([0], [0], ls="", color=cmap(norm(v)), ms=ms, **lkw)
-
-        # Save handle and label
-        handles.append(h)
-        labels.append(fmt.format(v))
+    handles = _legend_handles(values, cmap, norm, sizefunc, lkw, sizes=sizes)
+    labels = [fmt.format(v) for v in values]
 
     # Check how the legend is to be oriented
     if orientation == 'h':
@@ -82,8 +82,9 @@ class Trendline:
         # Get Gradient at the point
         grady = self.dfunc(x, *self.poly)
 
-        # Get diagonal covariance
-        var = np.diag(grady @ self.cov @ grady.T)
+        # Get diagonal covariance. Only the diagonal of G C G^T is needed,
+        # the row-wise products avoid building the full N x N matrix
+        var = np.sum((grady @ self.cov) * grady, axis=1)
 
         # Get 95 confidence interval
         self.conf = 1.96 * np.sqrt(var)
@@ -12,6 +12,8 @@ from .get_url_paths import get_url_paths  # noqa
 from .ln import ln  # noqa
 from .readfile import readfile  # noqa
 from .run_cmds_parallel import run_cmds_parallel  # noqa
+from .run_cmds_parallel import submit_cmds  # noqa
+from .run_cmds_parallel import wait_cmds  # noqa
 from .touch import touch  # noqa
 from .unzip import unzip  # noqa
 from .ungzip import ungzip  # noqa
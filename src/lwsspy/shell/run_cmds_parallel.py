@@ -2,31 +2,47 @@ import sys
 from subprocess import Popen, PIPE
 
 
-def run_cmds_parallel(cmd_list, cwdlist=None):
-    """Takes in a list of shell commands:
+def submit_cmds(cmd_list, cwdlist=None):
+    """Starts a list of shell commands without waiting for them, so that
+    other work can be done while they run. Use ``wait_cmds`` to collect them.
 
     Parameters
     ----------
     cmd_list : list
         List of list of arguments
+    cwdlist : list, optional
+        List of working directories, one per command, by default None
 
-    Last modified: Lucas Sawade, 2020.11.04 09.00 (lsawade@princeton.edu)
+    Returns
+    -------
+    list
+        List of the running ``Popen`` processes
     """
 
     # Create list of processes that immediately start execution
     if cwdlist is None:
         cwdlist = len(cmd_list) * [None]
 
-    process_list = [Popen(cmd, stdout=PIPE, stderr=PIPE, cwd=cwd)
-                    for cmd, cwd in zip(cmd_list, cwdlist)]
+    return [Popen(cmd, stdout=PIPE, stderr=PIPE, cwd=cwd)
+            for cmd, cwd in zip(cmd_list, cwdlist)]
+
+
+def wait_cmds(process_list):
+    """Waits for processes started with ``submit_cmds`` to finish and prints
+    their RETURNCODE, STDOUT and STDERR. Exits if one of them failed.
+
+    Parameters
+    ----------
+    process_list : list
+        List of ``Popen`` processes
+    """
 
-    # Wait for the processes to finish
-    for proc in process_list:
-        proc.wait()
+    # Wait for the processes to finish. communicate() drains the pipes while
+    # waiting, so processes with a lot of output can't block on a full pipe.
+    outputs = [proc.communicate() for proc in process_list]
 
     # Print RETURNCODE, STDOUT and STDERR
-    for proc in process_list:
-        out, err = proc.communicate()
+    for proc, (out, err) in zip(process_list, outputs):
         if proc.returncode != 0:
             print(proc.returncode)
         if (out != b''):
@@ -35,3 +51,20 @@ def run_cmds_parallel(cmd_list, cwdlist=None):
             print(err.decode())
         if proc.returncode != 0:
             sys.exit()
+
+
+def run_cmds_parallel(cmd_list, cwdlist=None):
+    """Takes in a list of shell commands, runs them in parallel and waits
+    for them to finish.
+
+    Parameters
+    ----------
+    cmd_list : list
+        List of list of arguments
+    cwdlist : list, optional
+        List of working directories, one per command, by default None
+
+    Last modified: Lucas Sawade, 2020.11.04 09.00 (lsawade@princeton.edu)
+    """
+
+    wait_cmds(submit_cmds(cmd_list, cwdlist=cwdlist))
@@ -1,5 +1,4 @@
 import numpy as np
-from copy import deepcopy
 
 
 def distance(x, y, x0: float, y0: float):
@@ -53,26 +52,23 @@ def even2Dpoints(n, width, height, radius, seed=None):
         x,y coordinates in 2D space
     """
 
-    # Initialize empty array
-    x = []
-    y = []
+    # Initialize arrays that are filled with the accepted points
+    x = np.empty(n)
+    y = np.empty(n)
+    N = 0
 
     if seed:
         np.random.seed(seed)
 
-    while len(x) < n:
-        flag = True
+    while N < n:
         # Get candidate
         xc = (np.random.random(1)[0] - 0.5) * width
         yc = (np.random.random(1)[0] - 0.5) * height
 
-        for ip in range(len(x)):
-            if distance(x[ip], y[ip], xc, yc) < radius * 2:
-                flag = False
-                break
+        # Check the distance to all accepted points at once
+        if np.all(distance(x[:N], y[:N], xc, yc) >= radius * 2):
+            x[N] = xc
+            y[N] = yc
+            N += 1
 
-        if flag is True:
-            x.append(deepcopy(xc))
-            y.append(deepcopy(yc))
-
-    return x, y
+    return list(x), list(y)
@@ -17,9 +17,18 @@ import os
 import json
 import yaml
 import logging
+import time
+from copy import deepcopy
+from functools import lru_cache
 import numpy as np
 import scipy.io as spio
 
+# Use the libyaml C bindings if pyyaml was built with them
+try:
+    from yaml import CFullLoader as _YamlLoader, CDumper as _YamlDumper
+except ImportError:
+    from yaml import FullLoader as _YamlLoader, Dumper as _YamlDumper
+
 # Internal imports
 
 
@@ -146,12 +155,43 @@ def write_yaml_file(d, filename, **kwargs):
 
     """
     with open(filename, 'w+') as yaml_file:
-        yaml.dump(d, yaml_file, default_flow_style=False, **kwargs)
+        yaml.dump(d, yaml_file, default_flow_style=False, Dumper=_YamlDumper,
+                  **kwargs)
 
 
-def read_yaml_file(filename):
+def _parse_yaml_file(filename):
     with open(filename, "rb") as fh:
-        return yaml.load(fh, Loader=yaml.FullLoader)
+        return yaml.load(fh, Loader=_YamlLoader)
+
+
+@lru_cache(maxsize=32)
+def _read_yaml_cached(filename, mtime, size, inode):
+    """Parses a yaml file. ``mtime``, ``size`` and ``inode`` are only part of
+    the cache key, so that a file that was modified is parsed again."""
+    return _parse_yaml_file(filename)
+
+
+def read_yaml_file(filename):
+    """Reads yaml file into a dictionary. Parsed files are cached on their
+    path, modification time, size and inode, so that reading the same file
+    repeatedly only costs a copy of the dictionary.
+
+    Files modified within the last couple of seconds are always parsed
+    again. On filesystems with coarse timestamps a rewrite within the same
+    tick would otherwise keep the old modification time.
+
+    Args:
+          filename: string with filename of the file to be read.
+
+    """
+    filename = os.path.abspath(filename)
+    stat = os.stat(filename)
+
+    if time.time() - stat.st_mtime < 2.0:
+        return _parse_yaml_file(filename)
+
+    return deepcopy(_read_yaml_cached(
+        filename, stat.st_mtime_ns, stat.st_size, stat.st_ino))
 
 
 def smart_read_yaml(yaml_file, mpi_mode=True, comm=None):
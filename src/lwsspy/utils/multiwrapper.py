@@ -48,8 +48,9 @@ def multiwrapper(function, varargs,
             results = pool.map(func, varargs)
     # In the case of a Stream, the results are Traces
     # But the output should be a trace again. So, we have to supply
-    # a function that brings that back to stream form
-    # def sumfunc(results): return Stream(results)
+    # a function that brings that back to stream form. The constructor
+    # itself does that, e.g. ``sumfunc=Stream``, no need to wrap it in a
+    # lambda (which can't be pickled either)
     if sumfunc is not None:
         results = sumfunc(results)
     return results
@@ -67,5 +68,9 @@ def starmap_with_kwargs(
         N: int):
     args_for_starmap = zip(repeat(fn), args_iter, kwargs_iter)
 
-    return pool.starmap(
-        apply_args_and_kwargs, args_for_starmap, N//pool._processes)
+    # Same heuristic as Pool.map: about four chunks per worker, which keeps
+    # the pickling/dispatch overhead low for many short tasks. Must be at
+    # least one, a chunksize of 0 silently maps nothing.
+    chunksize = max(1, N // (4 * pool._processes))
+
+    return pool.starmap(apply_args_and_kwargs, args_for_starmap, chunksize)
@@ -1,11 +1,7 @@
-
-import numpy as np
-
-
 def reduce_fontsize(fontsize):
 
-    if type(fontsize) == int or type(fontsize) == float:
-        newfontsize = int(np.round(0.7*fontsize))
+    if isinstance(fontsize, (int, float)):
+        newfontsize = int(round(0.7*fontsize))
     else:
 
         fontsizelist = ['xx-small', 'x-small', 'small',
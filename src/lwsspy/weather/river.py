@@ -2,7 +2,6 @@
 
 
 import os
-from copy import deepcopy
 import numpy as np
 from matplotlib.dates import datestr2num
 import matplotlib.pyplot as plt
@@ -207,9 +206,10 @@ class River:
 
     @staticmethod
     def fix_date_gaps(x, pos, date=False):
-        # List vs. numpy array management
+        # List vs. numpy array management. The entries are scalars, so a
+        # shallow copy is enough to protect the input from the insertions
         if type(x) is list:
-            y = deepcopy(x)
+            y = list(x)
         else:
             y = x.tolist()
 
@@ -149,5 +149,27 @@ def testspacing():
         #     raise AssertionError
 
 
+def test_fix_map_extents():
+    """Batch version should give the same extents as the single one."""
+
+    extents = [[-179, 179, -89, 10], [0, 10, 0, 10], [-20, 40, 30, 89]]
+
+    fixed = lmap.fix_map_extents(extents)
+
+    for _ext, _fixed in zip(extents, fixed):
+        np.testing.assert_allclose(_fixed, lmap.fix_map_extent(_ext))
+
+
+def test_gctrack_antipodal():
+    """Antipodal waypoints are connected along a meridian."""
+
+    qlat, qlon, qdists = lmap.gctrack([0.0, 0.0], [0.0, 180.0], 1.0)
+
+    assert len(qlat) == 181
+    np.testing.assert_allclose(np.diff(qdists), 1.0)
+    np.testing.assert_allclose(qlat[90], 90.0)
+    np.testing.assert_allclose(qdists[-1], 180.0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,3 +12,8 @@ def test_magnitude():
     assert lmat.magnitude(2302342) == 6
     assert lmat.magnitude(0) == 0
     assert_array_almost_equal(lmat.magnitude((245, 0, 0.00004)), (2, 0, -5))
+    assert_array_almost_equal(
+        lmat.magnitude(np.array([[1e5, 0], [-3e-2, 7]])), [[5, 0], [-2, 0]])
+    assert lmat.magnitude(np.inf) == np.inf
+    assert lmat.magnitude(-np.inf) == np.inf
+    assert np.isnan(lmat.magnitude(np.nan))
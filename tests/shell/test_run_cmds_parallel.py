@@ -0,0 +1,20 @@
+import pytest
+from lwsspy.shell import submit_cmds, wait_cmds
+
+
+def test_submit_wait_cmds(capsys):
+
+    # Processes are returned while they are running
+    procs = submit_cmds([['true'], ['echo', 'x']])
+    assert len(procs) == 2
+
+    wait_cmds(procs)
+
+    assert [proc.returncode for proc in procs] == [0, 0]
+    assert capsys.readouterr().out == "x\n\n"
+
+
+def test_wait_cmds_failure():
+
+    with pytest.raises(SystemExit):
+        wait_cmds(submit_cmds([['false']]))
@@ -0,0 +1,27 @@
+import os
+from lwsspy.utils import read_yaml_file, write_yaml_file
+
+
+def test_read_yaml_file_rewrite(tmp_path):
+
+    filename = os.path.join(tmp_path, "test.yml")
+
+    # Old timestamps so that the cache is used
+    write_yaml_file(dict(a=1, b=[1, 2]), filename)
+    os.utime(filename, ns=(0, 10**9))
+
+    d = read_yaml_file(filename)
+    assert d == dict(a=1, b=[1, 2])
+
+    # Returned dictionaries don't share state with the cache
+    d["b"].append(3)
+    assert read_yaml_file(filename) == dict(a=1, b=[1, 2])
+
+    # Rewrite within the same timestamp tick
+    write_yaml_file(dict(a=1, b=[1, 2, 3, 4]), filename)
+    os.utime(filename, ns=(0, 10**9))
+    assert read_yaml_file(filename) == dict(a=1, b=[1, 2, 3, 4])
+
+    # Freshly written files are always read again
+    write_yaml_file(dict(a=2, b=[1, 2, 3, 4]), filename)
+    assert read_yaml_file(filename) == dict(a=2, b=[1, 2, 3, 4])